@@ -1,34 +1,46 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Query
+from fastapi import FastAPI, APIRouter, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from starlette.middleware.gzip import GZipMiddleware
+from pymongo import ASCENDING, DESCENDING, AsyncMongoClient, IndexModel, ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError, OperationFailure, PyMongoError
+from bson import ObjectId
+from bson.errors import InvalidId
+import asyncio
+import base64
+import hashlib
 import os
 import logging
+import re
+import time
 from pathlib import Path
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from typing import List, Literal, Optional
 import uuid
 from datetime import datetime, date, timedelta
 from enum import Enum
-import json
-
-# Custom JSON encoder for date objects
-class DateTimeEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, date):
-            return obj.isoformat()
-        return super().default(obj)
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+# maxPoolSize should track worker concurrency (uvicorn workers x concurrent requests per worker)
+# and must stay >= 6 so the dashboard's concurrent queries actually overlap.
+# minPoolSize keeps warm connections so early requests skip the handshake.
+client = AsyncMongoClient(
+    mongo_url,
+    maxPoolSize=int(os.environ.get('MONGO_MAX_POOL_SIZE', 50)),
+    minPoolSize=int(os.environ.get('MONGO_MIN_POOL_SIZE', 10)),
+    serverSelectionTimeoutMS=2000,
+    waitQueueTimeoutMS=2000
+)
 db = client[os.environ['DB_NAME']]
 
 # Create the main app without a prefix
-app = FastAPI()
+# orjson serializes dates, datetimes and enums natively
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -60,9 +72,43 @@ class GradeLevel(str, Enum):
     GRADE_11 = "Grade 11"
     GRADE_12 = "Grade 12"
 
+# BSON has no date-only type, so date fields are stored as midnight datetimes
+DATE_FIELDS = ("date_of_birth", "enrollment_date", "hire_date")
+
+def new_object_id() -> str:
+    return str(ObjectId())
+
+def to_mongo(data: dict) -> dict:
+    """Convert a model dict to its stored form: id becomes the ObjectId _id, dates become datetimes"""
+    if "id" in data:
+        data["_id"] = ObjectId(data.pop("id"))
+    for field in DATE_FIELDS:
+        value = data.get(field)
+        if isinstance(value, date) and not isinstance(value, datetime):
+            data[field] = datetime.combine(value, datetime.min.time())
+    return data
+
+def from_mongo(doc: dict) -> dict:
+    """Convert a stored document back to model fields"""
+    if "_id" in doc:
+        doc["id"] = str(doc.pop("_id"))
+    for field in DATE_FIELDS:
+        value = doc.get(field)
+        if isinstance(value, datetime):
+            doc[field] = value.date()
+    return doc
+
+def parse_object_id(value: str, not_found: str) -> ObjectId:
+    """Turn a path id into an ObjectId; malformed ids cannot match anything"""
+    if not ObjectId.is_valid(value):
+        raise HTTPException(status_code=404, detail=not_found)
+    return ObjectId(value)
+
+EMAIL_RE = re.compile(r".+@.+")
+
 # Models
 class Student(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_object_id)
     student_id: str
     first_name: str
     last_name: str
@@ -80,21 +126,36 @@ class Student(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
-    @validator('email', pre=True, always=True)
+    @field_validator('email', mode='before')
+    @classmethod
     def validate_email(cls, v):
-        if v and v.strip() and '@' not in v:
+        if v is None:
+            return v
+        if v.strip() and not EMAIL_RE.match(v):
             raise ValueError('Invalid email format')
         return v
-    
-    def dict(self, **kwargs):
-        """Override dict method to handle date serialization"""
-        data = super().dict(**kwargs)
-        # Convert date objects to strings for MongoDB
-        if isinstance(data.get('date_of_birth'), date):
-            data['date_of_birth'] = data['date_of_birth'].isoformat()
-        if isinstance(data.get('enrollment_date'), date):
-            data['enrollment_date'] = data['enrollment_date'].isoformat()
-        return data
+
+class StudentListItem(BaseModel):
+    """Lightweight student row for table views"""
+    id: str
+    student_id: str
+    first_name: str
+    last_name: str
+    email: Optional[str] = None
+    grade_level: GradeLevel
+    status: StudentStatus
+    parent_name: Optional[str] = None
+    created_at: datetime
+
+# Internal fields are never returned to clients. "id" is the UUID key older documents
+# carry alongside _id; the API id is now always the _id.
+STUDENT_PROJECTION = {"id": 0, "search_keys": 0}
+# Only fetch the fields StudentListItem needs (_id is always included)
+STUDENT_LIST_PROJECTION = {field: 1 for field in StudentListItem.model_fields if field != "id"}
+
+class StudentPage(BaseModel):
+    items: List[Student]
+    total: int
 
 class StudentCreate(BaseModel):
     student_id: str
@@ -125,7 +186,7 @@ class StudentUpdate(BaseModel):
     parent_phone: Optional[str] = None
 
 class Teacher(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_object_id)
     teacher_id: str
     first_name: str
     last_name: str
@@ -135,14 +196,6 @@ class Teacher(BaseModel):
     hire_date: date = Field(default_factory=date.today)
     status: str = "active"
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    
-    def dict(self, **kwargs):
-        """Override dict method to handle date serialization"""
-        data = super().dict(**kwargs)
-        # Convert date objects to strings for MongoDB
-        if isinstance(data.get('hire_date'), date):
-            data['hire_date'] = data['hire_date'].isoformat()
-        return data
 
 class TeacherCreate(BaseModel):
     teacher_id: str
@@ -153,7 +206,7 @@ class TeacherCreate(BaseModel):
     subject_specialization: Optional[str] = None
 
 class Course(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_object_id)
     course_code: str
     course_name: str
     description: Optional[str] = None
@@ -168,6 +221,21 @@ class CourseCreate(BaseModel):
     credit_hours: Optional[int] = None
     grade_levels: List[GradeLevel] = []
 
+class BatchOperation(BaseModel):
+    method: Literal["POST"]
+    path: str
+    body: dict
+
+# Operations in a batch run concurrently, so keep a batch well under the Mongo connection pool
+MAX_BATCH_SIZE = 20
+
+class BatchRequest(BaseModel):
+    requests: List[BatchOperation] = Field(max_length=MAX_BATCH_SIZE)
+
+class BatchResult(BaseModel):
+    status: int
+    body: dict
+
 class DashboardStats(BaseModel):
     total_students: int
     active_students: int
@@ -185,27 +253,84 @@ class StatusCheck(BaseModel):
 class StatusCheckCreate(BaseModel):
     client_name: str
 
+# Dashboard stats change slowly, so serve them from a short-lived process-local cache.
+# Writes through this API clear it, and change streams on the underlying collections clear it
+# for writes from elsewhere (they need a replica set). Each clear bumps the generation, so a
+# computation that was already running when data changed doesn't store its stale result.
+STATS_CACHE_TTL = 30  # seconds
+_stats_cache = {"value": None, "expires": 0.0, "generation": 0}
+_stats_lock = asyncio.Lock()
+_stats_watchers = []
+
+def invalidate_dashboard_stats():
+    _stats_cache["value"] = None
+    _stats_cache["generation"] += 1
+
+async def watch_stats_collection(collection):
+    """Clear the dashboard stats cache whenever the collection changes"""
+    pipeline = [{"$match": {"operationType": {"$in": ["insert", "update", "replace", "delete"]}}}]
+    delay = 1
+    while True:
+        opened = False
+        try:
+            async with await collection.watch(pipeline) as stream:
+                opened = True
+                delay = 1
+                # Changes may have been missed while the stream was down
+                invalidate_dashboard_stats()
+                async for _ in stream:
+                    invalidate_dashboard_stats()
+        except OperationFailure as e:
+            if not opened:
+                # Change streams need a replica set; writes from other clients then wait out the TTL
+                logger.warning(f"Change stream on {collection.name} unavailable: {e}")
+                return
+            logger.warning(f"Change stream on {collection.name} failed, reopening in {delay}s: {e}")
+        except PyMongoError as e:
+            # Failovers and network errors are transient, so keep reopening the stream with backoff
+            logger.warning(f"Change stream on {collection.name} interrupted, reopening in {delay}s: {e}")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 60)
+
 # Dashboard and Statistics
 @api_router.get("/dashboard/stats", response_model=DashboardStats)
 async def get_dashboard_stats():
-    # Count total students
-    total_students = await db.students.count_documents({})
-    active_students = await db.students.count_documents({"status": "active"})
-    total_teachers = await db.teachers.count_documents({})
-    total_courses = await db.courses.count_documents({})
+    stats = _stats_cache["value"]
+    if stats is not None and time.monotonic() < _stats_cache["expires"]:
+        return stats
     
-    # Students by grade
+    # Only one request recomputes on a miss; the others wait and reuse its result
+    async with _stats_lock:
+        stats = _stats_cache["value"]
+        if stats is None or time.monotonic() >= _stats_cache["expires"]:
+            generation = _stats_cache["generation"]
+            stats = await compute_dashboard_stats()
+            if _stats_cache["generation"] == generation:
+                _stats_cache["value"] = stats
+                _stats_cache["expires"] = time.monotonic() + STATS_CACHE_TTL
+    return stats
+
+async def compute_dashboard_stats() -> DashboardStats:
     pipeline = [
         {"$group": {"_id": "$grade_level", "count": {"$sum": 1}}}
     ]
-    grade_counts = await db.students.aggregate(pipeline).to_list(None)
-    students_by_grade = {item["_id"]: item["count"] for item in grade_counts}
-    
     # Recent enrollments (last 30 days)
-    thirty_days_ago = (datetime.utcnow() - timedelta(days=30)).date().isoformat()
-    recent_enrollments = await db.students.count_documents({
-        "enrollment_date": {"$gte": thirty_days_ago}
-    })
+    thirty_days_ago = datetime.combine((datetime.utcnow() - timedelta(days=30)).date(), datetime.min.time())
+    
+    async def count_by_grade():
+        return {item["_id"]: item["count"] async for item in await db.students.aggregate(pipeline)}
+    
+    # All six queries are independent, so run them concurrently.
+    # Unfiltered totals come from collection metadata; the rest need a query.
+    (total_students, active_students, total_teachers, total_courses,
+     students_by_grade, recent_enrollments) = await asyncio.gather(
+        db.students.estimated_document_count(),
+        db.students.count_documents({"status": "active"}),
+        db.teachers.estimated_document_count(),
+        db.courses.estimated_document_count(),
+        count_by_grade(),
+        db.students.count_documents({"enrollment_date": {"$gte": thirty_days_ago}})
+    )
     
     return DashboardStats(
         total_students=total_students,
@@ -219,34 +344,41 @@ async def get_dashboard_stats():
 # Student CRUD Operations
 @api_router.post("/students", response_model=Student)
 async def create_student(student: StudentCreate):
-    # Check if student_id already exists
-    existing = await db.students.find_one({"student_id": student.student_id})
-    if existing:
-        raise HTTPException(status_code=400, detail="Student ID already exists")
-    
-    student_dict = student.dict()
+    student_dict = student.model_dump()
     student_obj = Student(**student_dict)
     
-    await db.students.insert_one(student_obj.dict())
+    # The unique index on student_id rejects duplicates atomically
+    try:
+        student_doc = to_mongo(student_obj.model_dump())
+        student_doc["search_keys"] = student_search_keys(student_doc)
+        await db.students.insert_one(student_doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Student ID already exists")
+    invalidate_dashboard_stats()
     return student_obj
 
-@api_router.get("/students", response_model=List[Student])
-async def get_students(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=100),
-    search: Optional[str] = Query(None),
-    grade_level: Optional[GradeLevel] = Query(None),
-    status: Optional[StudentStatus] = Query(None)
-):
+# Lowercased copies of the searchable fields are stored in search_keys so that typeahead
+# searches can run as an anchored, case-sensitive prefix regex, which MongoDB answers with
+# a bounded index scan. Case-insensitive regexes (and collation) cannot use an index.
+# Keys are always lowercased in Python, like the search term: Mongo's $toLower only handles ASCII.
+STUDENT_SEARCH_FIELDS = ("first_name", "last_name", "student_id", "email")
+
+def search_key(value) -> str:
+    return str(value or "").lower()
+
+def student_search_keys(data: dict) -> List[str]:
+    return [search_key(data.get(field)) for field in STUDENT_SEARCH_FIELDS]
+
+def build_student_query(search: Optional[str], grade_level: Optional[GradeLevel], status: Optional[StudentStatus]) -> dict:
+    """Build the filter shared by the student list, count and page endpoints"""
     query = {}
     
     if search:
-        query["$or"] = [
-            {"first_name": {"$regex": search, "$options": "i"}},
-            {"last_name": {"$regex": search, "$options": "i"}},
-            {"student_id": {"$regex": search, "$options": "i"}},
-            {"email": {"$regex": search, "$options": "i"}}
-        ]
+        if len(search.split()) == 1:
+            query["search_keys"] = {"$regex": f"^{re.escape(search.strip().lower())}"}
+        else:
+            # Multi-word queries go through the text index
+            query["$text"] = {"$search": search}
     
     if grade_level:
         query["grade_level"] = grade_level
@@ -254,16 +386,68 @@ async def get_students(
     if status:
         query["status"] = status
     
-    students = await db.students.find(query).skip(skip).limit(limit).sort("created_at", -1).to_list(limit)
-    # Convert string dates back to date objects
-    result = []
-    for student_data in students:
-        if isinstance(student_data.get('date_of_birth'), str):
-            student_data['date_of_birth'] = datetime.fromisoformat(student_data['date_of_birth']).date()
-        if isinstance(student_data.get('enrollment_date'), str):
-            student_data['enrollment_date'] = datetime.fromisoformat(student_data['enrollment_date']).date()
-        result.append(Student(**student_data))
-    return result
+    return query
+
+# Keyset pagination cursors are opaque to clients: base64 of the last row's (created_at, _id)
+def encode_cursor(doc: dict) -> str:
+    raw = f"{doc['created_at'].isoformat()}|{doc['_id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor: str):
+    try:
+        created_at, last_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), ObjectId(last_id)
+    except (ValueError, InvalidId):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+async def find_students(response: Response, projection: dict, skip: int, limit: int, search: Optional[str],
+                        grade_level: Optional[GradeLevel], status: Optional[StudentStatus],
+                        after: Optional[str]) -> List[dict]:
+    """One page of students for the list endpoints, newest first. Sets X-Next-Cursor on full pages."""
+    query = build_student_query(search, grade_level, status)
+    
+    if after:
+        # Resume after the last row of the previous page instead of skipping over it
+        after_created_at, after_id = decode_cursor(after)
+        query["$or"] = [
+            {"created_at": {"$lt": after_created_at}},
+            {"created_at": after_created_at, "_id": {"$gt": after_id}}
+        ]
+    
+    cursor = db.students.find(query, projection).sort([("created_at", DESCENDING), ("_id", ASCENDING)])
+    if skip and not after:
+        # Offset paging is kept for older clients; it walks and discards `skip` rows
+        cursor = cursor.skip(skip)
+    students = await cursor.limit(limit).to_list(limit)
+    if len(students) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(students[-1])
+    # Plain dicts: response_model validates and serializes them once
+    return [from_mongo(student_data) for student_data in students]
+
+@api_router.get("/students", response_model=List[Student])
+async def get_students(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
+    search: Optional[str] = Query(None),
+    grade_level: Optional[GradeLevel] = Query(None),
+    status: Optional[StudentStatus] = Query(None),
+    after: Optional[str] = Query(None)
+):
+    return await find_students(response, STUDENT_PROJECTION, skip, limit, search, grade_level, status, after)
+
+@api_router.get("/students/summary", response_model=List[StudentListItem])
+async def get_students_summary(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
+    search: Optional[str] = Query(None),
+    grade_level: Optional[GradeLevel] = Query(None),
+    status: Optional[StudentStatus] = Query(None),
+    after: Optional[str] = Query(None)
+):
+    """Like /students, but only the fields a table row needs"""
+    return await find_students(response, STUDENT_LIST_PROJECTION, skip, limit, search, grade_level, status, after)
 
 @api_router.get("/students/count")
 async def get_students_count(
@@ -271,122 +455,149 @@ async def get_students_count(
     grade_level: Optional[GradeLevel] = Query(None),
     status: Optional[StudentStatus] = Query(None)
 ):
-    query = {}
-    
-    if search:
-        query["$or"] = [
-            {"first_name": {"$regex": search, "$options": "i"}},
-            {"last_name": {"$regex": search, "$options": "i"}},
-            {"student_id": {"$regex": search, "$options": "i"}},
-            {"email": {"$regex": search, "$options": "i"}}
-        ]
-    
-    if grade_level:
-        query["grade_level"] = grade_level
-    
-    if status:
-        query["status"] = status
+    query = build_student_query(search, grade_level, status)
     
     count = await db.students.count_documents(query)
     return {"count": count}
 
+@api_router.get("/students/page", response_model=StudentPage)
+async def get_students_page(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
+    search: Optional[str] = Query(None),
+    grade_level: Optional[GradeLevel] = Query(None),
+    status: Optional[StudentStatus] = Query(None)
+):
+    """Return a page of students and the total match count in one round-trip"""
+    # The sort stays outside $facet: stages inside a facet can't use indexes, so a sort there
+    # would be an in-memory sort of every match instead of a walk of the created_at index
+    pipeline = [
+        {"$match": build_student_query(search, grade_level, status)},
+        {"$sort": {"created_at": -1, "_id": 1}},
+        {"$facet": {
+            "items": [
+                {"$skip": skip},
+                {"$limit": limit},
+                {"$project": STUDENT_PROJECTION}
+            ],
+            "total": [{"$count": "count"}]
+        }}
+    ]
+    cursor = await db.students.aggregate(pipeline)
+    result = (await cursor.to_list(1))[0]
+    total = result["total"][0]["count"] if result["total"] else 0
+    return {"items": [from_mongo(student_data) for student_data in result["items"]], "total": total}
+
 @api_router.get("/students/{student_id}", response_model=Student)
 async def get_student(student_id: str):
-    student = await db.students.find_one({"id": student_id})
+    student = await db.students.find_one({"_id": parse_object_id(student_id, "Student not found")}, STUDENT_PROJECTION)
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
     
-    # Convert string dates back to date objects
-    if isinstance(student.get('date_of_birth'), str):
-        student['date_of_birth'] = datetime.fromisoformat(student['date_of_birth']).date()
-    if isinstance(student.get('enrollment_date'), str):
-        student['enrollment_date'] = datetime.fromisoformat(student['enrollment_date']).date()
-    
-    return Student(**student)
+    return from_mongo(student)
 
 @api_router.put("/students/{student_id}", response_model=Student)
 async def update_student(student_id: str, student_update: StudentUpdate):
-    student = await db.students.find_one({"id": student_id})
-    if not student:
-        raise HTTPException(status_code=404, detail="Student not found")
+    update_data = to_mongo(student_update.model_dump(exclude_unset=True))
+    update_data["updated_at"] = datetime.utcnow()
     
-    update_data = student_update.dict(exclude_unset=True)
-    if update_data:
-        # Convert date objects to strings for MongoDB
-        if 'date_of_birth' in update_data and isinstance(update_data['date_of_birth'], date):
-            update_data['date_of_birth'] = update_data['date_of_birth'].isoformat()
-        
-        update_data["updated_at"] = datetime.utcnow()
-        await db.students.update_one({"id": student_id}, {"$set": update_data})
+    # Keep the search key of each changed searchable field in step with it
+    search_key_updates = {f"search_keys.{i}": search_key(update_data[field])
+                          for i, field in enumerate(STUDENT_SEARCH_FIELDS) if field in update_data}
     
-    updated_student = await db.students.find_one({"id": student_id})
-    
-    # Convert string dates back to date objects
-    if isinstance(updated_student.get('date_of_birth'), str):
-        updated_student['date_of_birth'] = datetime.fromisoformat(updated_student['date_of_birth']).date()
-    if isinstance(updated_student.get('enrollment_date'), str):
-        updated_student['enrollment_date'] = datetime.fromisoformat(updated_student['enrollment_date']).date()
+    # Apply the update and fetch the new document in a single round-trip
+    updated_student = await db.students.find_one_and_update(
+        {"_id": parse_object_id(student_id, "Student not found")},
+        {"$set": {**update_data, **search_key_updates}},
+        projection=STUDENT_PROJECTION,
+        return_document=ReturnDocument.AFTER
+    )
+    if not updated_student:
+        raise HTTPException(status_code=404, detail="Student not found")
+    invalidate_dashboard_stats()
     
-    return Student(**updated_student)
+    return from_mongo(updated_student)
 
 @api_router.delete("/students/{student_id}")
 async def delete_student(student_id: str):
-    result = await db.students.delete_one({"id": student_id})
+    result = await db.students.delete_one({"_id": parse_object_id(student_id, "Student not found")})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Student not found")
+    invalidate_dashboard_stats()
     return {"message": "Student deleted successfully"}
 
 # Teacher CRUD Operations
 @api_router.post("/teachers", response_model=Teacher)
 async def create_teacher(teacher: TeacherCreate):
-    existing = await db.teachers.find_one({"teacher_id": teacher.teacher_id})
-    if existing:
-        raise HTTPException(status_code=400, detail="Teacher ID already exists")
-    
-    teacher_dict = teacher.dict()
+    teacher_dict = teacher.model_dump()
     teacher_obj = Teacher(**teacher_dict)
     
-    await db.teachers.insert_one(teacher_obj.dict())
+    try:
+        await db.teachers.insert_one(to_mongo(teacher_obj.model_dump()))
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Teacher ID already exists")
+    invalidate_dashboard_stats()
     return teacher_obj
 
 @api_router.get("/teachers", response_model=List[Teacher])
 async def get_teachers():
-    teachers = await db.teachers.find().sort("created_at", -1).to_list(100)
-    result = []
-    for teacher_data in teachers:
-        if isinstance(teacher_data.get('hire_date'), str):
-            teacher_data['hire_date'] = datetime.fromisoformat(teacher_data['hire_date']).date()
-        result.append(Teacher(**teacher_data))
-    return result
+    teachers = db.teachers.find({}, {"id": 0}).sort("created_at", -1).limit(100)
+    return [from_mongo(teacher_data) async for teacher_data in teachers]
 
 @api_router.get("/teachers/{teacher_id}", response_model=Teacher)
 async def get_teacher(teacher_id: str):
-    teacher = await db.teachers.find_one({"id": teacher_id})
+    teacher = await db.teachers.find_one({"_id": parse_object_id(teacher_id, "Teacher not found")}, {"id": 0})
     if not teacher:
         raise HTTPException(status_code=404, detail="Teacher not found")
     
-    if isinstance(teacher.get('hire_date'), str):
-        teacher['hire_date'] = datetime.fromisoformat(teacher['hire_date']).date()
-    
-    return Teacher(**teacher)
+    return from_mongo(teacher)
 
 # Course CRUD Operations
 @api_router.post("/courses", response_model=Course)
 async def create_course(course: CourseCreate):
-    existing = await db.courses.find_one({"course_code": course.course_code})
-    if existing:
-        raise HTTPException(status_code=400, detail="Course code already exists")
-    
-    course_dict = course.dict()
+    course_dict = course.model_dump()
     course_obj = Course(**course_dict)
     
-    await db.courses.insert_one(course_obj.dict())
+    try:
+        await db.courses.insert_one(to_mongo(course_obj.model_dump()))
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Course code already exists")
+    invalidate_dashboard_stats()
     return course_obj
 
 @api_router.get("/courses", response_model=List[Course])
 async def get_courses():
-    courses = await db.courses.find().sort("created_at", -1).to_list(100)
-    return [Course(**course) for course in courses]
+    courses = db.courses.find({}, {"id": 0}).sort("created_at", -1).limit(100)
+    return [from_mongo(course) async for course in courses]
+
+# Batch creation: several creates in one round trip. Each operation is validated and handled
+# as its standalone route would be, and succeeds or fails independently of the others.
+BATCH_CREATES = {
+    "/students": (StudentCreate, create_student),
+    "/teachers": (TeacherCreate, create_teacher),
+    "/courses": (CourseCreate, create_course),
+}
+
+async def run_batch_operation(operation: BatchOperation) -> BatchResult:
+    route = BATCH_CREATES.get(operation.path)
+    if route is None:
+        return BatchResult(status=404, body={"detail": "Not Found"})
+    model, handler = route
+    try:
+        created = await handler(model.model_validate(operation.body))
+    except ValidationError as e:
+        return BatchResult(status=422, body={"detail": e.errors(include_url=False, include_context=False)})
+    except HTTPException as e:
+        return BatchResult(status=e.status_code, body={"detail": e.detail})
+    except PyMongoError as e:
+        # Fail just this operation; the others may already have been written
+        logger.warning(f"Batch {operation.path} operation failed: {e}")
+        return BatchResult(status=503, body={"detail": "Database unavailable"})
+    return BatchResult(status=200, body=created.model_dump())
+
+@api_router.post("/batch", response_model=List[BatchResult])
+async def batch(batch_request: BatchRequest):
+    return await asyncio.gather(*(run_batch_operation(operation) for operation in batch_request.requests))
 
 # Original routes
 @api_router.get("/")
@@ -395,25 +606,85 @@ async def root():
 
 @api_router.post("/status", response_model=StatusCheck)
 async def create_status_check(input: StatusCheckCreate):
-    status_dict = input.dict()
+    status_dict = input.model_dump()
     status_obj = StatusCheck(**status_dict)
-    _ = await db.status_checks.insert_one(status_obj.dict())
+    _ = await db.status_checks.insert_one(status_obj.model_dump())
     return status_obj
 
 @api_router.get("/status", response_model=List[StatusCheck])
 async def get_status_checks():
-    status_checks = await db.status_checks.find().to_list(1000)
-    return [StatusCheck(**status_check) for status_check in status_checks]
+    status_checks = db.status_checks.find({}, {"_id": 0}).limit(1000)
+    return [status_check async for status_check in status_checks]
 
 # Include the router in the main app
 app.include_router(api_router)
 
+# Successful GETs carry a weak ETag of their body; a client that sends it back in If-None-Match
+# gets an empty 304 instead. It's weak because GZip, which wraps this, may compress the body.
+# The tag is a hash of the finished response, so the query and serialization still run: a 304
+# only saves bandwidth (mostly for browsers revalidating their cached GETs), not server work.
+class ETagMiddleware:
+    """Plain ASGI middleware, so requests other than GET pass straight through untouched"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        chunks = []
+
+        async def buffer_ok_response(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    await send(message)
+                else:
+                    start = message
+                return
+            if start is None:
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'.encode()
+            # If-None-Match may be repeated; each header holds a comma-separated list of tags
+            tags = {tag.strip() for name, value in scope["headers"] if name == b"if-none-match"
+                    for tag in value.split(b",")}
+            if etag in tags:
+                await send({"type": "http.response.start", "status": 304, "headers": [(b"etag", etag)]})
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send({**start, "headers": [*start["headers"], (b"etag", etag)]})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, buffer_ok_response)
+
+app.add_middleware(ETagMiddleware)
+
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
+# Explicit origins (comma-separated FRONTEND_URL) let browsers cache credentialed preflights;
+# max_age keeps each cached preflight for a day. With credentials allowed a wildcard would
+# echo back any origin, so "*" is never accepted and a missing FRONTEND_URL allows no origins.
+frontend_origins = [origin.strip() for origin in os.environ.get('FRONTEND_URL', '').split(',')
+                    if origin.strip() and origin.strip() != '*']
+if not frontend_origins:
+    logging.getLogger(__name__).warning("FRONTEND_URL lists no origins; cross-origin requests will be refused")
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=["*"],
+    allow_origins=frontend_origins,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
+    max_age=86400,
 )
 
 # Configure logging
@@ -423,6 +694,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def warm_up_db_client():
+    # Force the initial handshake before the first user request
+    await db.command("ping")
+
+@app.on_event("startup")
+async def create_indexes():
+    await db.students.create_indexes([
+        IndexModel([("first_name", "text"), ("last_name", "text"), ("student_id", "text"), ("email", "text")],
+                   name="student_search_text"),
+        # Equality filters first, then the created_at sort key, so list pages walk the index in order
+        IndexModel([("status", ASCENDING), ("grade_level", ASCENDING), ("created_at", DESCENDING), ("_id", ASCENDING)]),
+        IndexModel([("grade_level", ASCENDING), ("created_at", DESCENDING), ("_id", ASCENDING)]),
+        IndexModel([("status", ASCENDING), ("created_at", DESCENDING), ("_id", ASCENDING)]),
+        IndexModel([("created_at", DESCENDING), ("_id", ASCENDING)]),
+        IndexModel([("student_id", ASCENDING)], unique=True),
+        IndexModel([("enrollment_date", DESCENDING)]),
+        IndexModel([("search_keys", ASCENDING)]),
+    ])
+    # Backfill search_keys for students created before the field existed, and repair keys that
+    # an earlier $toLower-based version left uppercase for non-ASCII names
+    fixes = []
+    async for student in db.students.find({}, ["search_keys", *STUDENT_SEARCH_FIELDS]):
+        keys = student_search_keys(student)
+        if student.get("search_keys") != keys:
+            fixes.append(UpdateOne({"_id": student["_id"]}, {"$set": {"search_keys": keys}}))
+    if fixes:
+        await db.students.bulk_write(fixes, ordered=False)
+    # Older documents stored dates as ISO strings, which date range queries never match
+    for collection in (db.students, db.teachers):
+        for field in DATE_FIELDS:
+            await collection.update_many(
+                {field: {"$type": "string"}},
+                [{"$set": {field: {"$dateFromString": {"dateString": f"${field}"}}}}]
+            )
+    await db.teachers.create_index("teacher_id", unique=True)
+    await db.courses.create_index("course_code", unique=True)
+
+@app.on_event("startup")
+async def start_stats_watchers():
+    for collection in (db.students, db.teachers, db.courses):
+        _stats_watchers.append(asyncio.create_task(watch_stats_collection(collection)))
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    for task in _stats_watchers:
+        task.cancel()
+    await asyncio.gather(*_stats_watchers, return_exceptions=True)
+    await client.close()
\ No newline at end of file
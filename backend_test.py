@@ -4,198 +4,437 @@ Comprehensive Backend API Testing for School Management Information System
 Tests all CRUD operations, search functionality, filtering, pagination, and error handling
 """
 
-import requests
-import json
+import argparse
+import orjson
+import re
 import sys
-from datetime import date, datetime
-from typing import Dict, List, Any
+import urllib3
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from typing import Any
+import threading
 import time
 
 # Backend URL from environment
 BACKEND_URL = "https://742fbbda-a33c-48cd-b803-8bcf74555207.preview.emergentagent.com/api"
 
+# Independent requests are issued concurrently, up to this many at a time
+MAX_WORKERS = 8
+
+# Request methods make_request accepts
+_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+
+class Response:
+    """The parts of a urllib3 response the tests use, under requests-style names"""
+    __slots__ = ("status_code", "content", "headers")
+
+    def __init__(self, status_code: int, content: bytes, headers: Mapping[str, str]) -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+
+def _json(response: Response) -> Any:
+    """Decode a response body with orjson"""
+    return orjson.loads(response.content)
+
+# Fixture records; POST bodies are never mutated, so the suites share these directly
+_STUDENTS_DATA = (
+    {
+        "student_id": "STU001",
+        "first_name": "Emma",
+        "last_name": "Johnson",
+        "email": "emma.johnson@email.com",
+        "phone": "555-0101",
+        "date_of_birth": "2010-03-15",
+        "gender": "female",
+        "grade_level": "Grade 8",
+        "address": "123 Oak Street, Springfield",
+        "parent_name": "Michael Johnson",
+        "parent_email": "michael.johnson@email.com",
+        "parent_phone": "555-0102"
+    },
+    {
+        "student_id": "STU002",
+        "first_name": "Liam",
+        "last_name": "Smith",
+        "email": "liam.smith@email.com",
+        "phone": "555-0201",
+        "date_of_birth": "2009-07-22",
+        "gender": "male",
+        "grade_level": "Grade 9",
+        "address": "456 Pine Avenue, Springfield",
+        "parent_name": "Sarah Smith",
+        "parent_email": "sarah.smith@email.com",
+        "parent_phone": "555-0202"
+    },
+    {
+        "student_id": "STU003",
+        "first_name": "Sophia",
+        "last_name": "Williams",
+        "email": "sophia.williams@email.com",
+        "phone": "555-0301",
+        "date_of_birth": "2011-11-08",
+        "gender": "female",
+        "grade_level": "Grade 7",
+        "address": "789 Maple Drive, Springfield",
+        "parent_name": "David Williams",
+        "parent_email": "david.williams@email.com",
+        "parent_phone": "555-0302"
+    },
+    {
+        "student_id": "STU004",
+        "first_name": "Noah",
+        "last_name": "Brown",
+        "email": "noah.brown@email.com",
+        "phone": "555-0401",
+        "date_of_birth": "2008-05-12",
+        "gender": "male",
+        "grade_level": "Grade 10",
+        "address": "321 Elm Street, Springfield",
+        "parent_name": "Jennifer Brown",
+        "parent_email": "jennifer.brown@email.com",
+        "parent_phone": "555-0402"
+    },
+    {
+        "student_id": "STU005",
+        "first_name": "Olivia",
+        "last_name": "Davis",
+        "email": "olivia.davis@email.com",
+        "phone": "555-0501",
+        "date_of_birth": "2012-01-30",
+        "gender": "female",
+        "grade_level": "Grade 6",
+        "address": "654 Cedar Lane, Springfield",
+        "parent_name": "Robert Davis",
+        "parent_email": "robert.davis@email.com",
+        "parent_phone": "555-0502"
+    }
+)
+
+_TEACHERS_DATA = (
+    {
+        "teacher_id": "TCH001",
+        "first_name": "Dr. Sarah",
+        "last_name": "Anderson",
+        "email": "sarah.anderson@school.edu",
+        "phone": "555-1001",
+        "subject_specialization": "Mathematics"
+    },
+    {
+        "teacher_id": "TCH002",
+        "first_name": "Mr. James",
+        "last_name": "Wilson",
+        "email": "james.wilson@school.edu",
+        "phone": "555-1002",
+        "subject_specialization": "English Literature"
+    },
+    {
+        "teacher_id": "TCH003",
+        "first_name": "Ms. Maria",
+        "last_name": "Garcia",
+        "email": "maria.garcia@school.edu",
+        "phone": "555-1003",
+        "subject_specialization": "Science"
+    }
+)
+
+_COURSES_DATA = (
+    {
+        "course_code": "MATH101",
+        "course_name": "Algebra I",
+        "description": "Introduction to algebraic concepts and problem solving",
+        "credit_hours": 3,
+        "grade_levels": ["Grade 8", "Grade 9"]
+    },
+    {
+        "course_code": "ENG201",
+        "course_name": "English Literature",
+        "description": "Study of classic and contemporary literature",
+        "credit_hours": 4,
+        "grade_levels": ["Grade 10", "Grade 11", "Grade 12"]
+    },
+    {
+        "course_code": "SCI301",
+        "course_name": "Biology",
+        "description": "Introduction to biological sciences",
+        "credit_hours": 4,
+        "grade_levels": ["Grade 9", "Grade 10"]
+    }
+)
+
+# Dashboard stats fields and the type each must have
+_DASHBOARD_FIELDS = ("total_students", "active_students", "total_teachers", "total_courses",
+                     "students_by_grade", "recent_enrollments")
+_DASHBOARD_TYPES = (int, int, int, int, dict, int)
+_get_dashboard_fields = itemgetter(*_DASHBOARD_FIELDS)
+
+# Building blocks for generated students in --scale runs
+_FIRST_NAMES = ("Ava", "Ben", "Chloe", "Dylan", "Ella", "Finn", "Grace", "Henry")
+_LAST_NAMES = ("Adams", "Baker", "Clark", "Diaz", "Evans", "Foster", "Green", "Hughes")
+_GRADE_LEVELS = tuple(f"Grade {grade}" for grade in range(1, 13))
+
+def build_students(n: int) -> list[dict[str, Any]]:
+    """Generate n distinct student payloads for scale runs"""
+    return [
+        {
+            "student_id": f"SCALE{i:06d}",
+            "first_name": _FIRST_NAMES[i % len(_FIRST_NAMES)],
+            "last_name": _LAST_NAMES[i // len(_FIRST_NAMES) % len(_LAST_NAMES)],
+            "email": f"scale.{i}@email.com",
+            "date_of_birth": f"{2006 + i % 12}-{1 + i % 12:02d}-{1 + i % 28:02d}",
+            "gender": "male" if i % 2 else "female",
+            "grade_level": _GRADE_LEVELS[i % len(_GRADE_LEVELS)]
+        }
+        for i in range(n)
+    ]
+
 class SchoolAPITester:
-    def __init__(self):
+    def __init__(self, verbose: bool = True, scale: int = 0, tee: bool = False) -> None:
         self.base_url = BACKEND_URL
-        self.session = requests.Session()
-        self.created_students = []
-        self.created_teachers = []
-        self.created_courses = []
-        self.test_results = {
+        self.verbose = verbose
+        self.scale = scale
+        self.tee = tee
+        # Size the connection pool for the concurrent batches and retry transient gateway errors;
+        # after the last retry the final response is returned rather than raised
+        self.http = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=32,
+            retries=urllib3.Retry(total=3, backoff_factor=0.1, status_forcelist=[502, 503, 504],
+                                  raise_on_status=False),
+            headers={
+                "Connection": "keep-alive",
+                "Accept-Encoding": "gzip",
+                "Content-Type": "application/json"
+            }
+        )
+        self.created_students: list[dict[str, Any]] = []
+        self.created_teachers: list[dict[str, Any]] = []
+        self.created_courses: list[dict[str, Any]] = []
+        self.test_results: dict[str, Any] = {
             "passed": 0,
             "failed": 0,
             "errors": []
         }
+        self._lock = threading.Lock()
+        # Holds a per-thread output buffer while suites run concurrently
+        self._local = threading.local()
+        self._out: list[str] = []
+
+    @staticmethod
+    def _status(response: Response | None) -> int | str:
+        """Status code for failure messages"""
+        return response.status_code if response is not None else 'No response'
+
+    def emit(self, text: str = "") -> None:
+        """Buffer a line of output; it is written out by flush().
+        While suites run concurrently, lines go to the current suite's own buffer."""
+        buffer = getattr(self._local, "buffer", None)
+        (self._out if buffer is None else buffer).append(text)
+
+    def flush(self) -> None:
+        """Write all buffered output with a single call"""
+        with self._lock:
+            out, self._out = self._out, []
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
+            sys.stdout.flush()
+
+    def run_concurrently(self, *suites: Callable[[], None]) -> None:
+        """Run independent test suites in parallel, keeping each suite's output as one block"""
+        def run(suite: Callable[[], None]) -> list[str]:
+            self._local.buffer = []
+            try:
+                suite()
+                return self._local.buffer
+            finally:
+                self._local.buffer = None
+        
+        with ThreadPoolExecutor(max_workers=len(suites)) as executor:
+            for lines in executor.map(run, suites):
+                with self._lock:
+                    self._out.extend(lines)
 
-    def log_result(self, test_name: str, success: bool, message: str = ""):
+    def log_result(self, test_name: str, success: bool, message: str = "") -> None:
         """Log test results"""
-        status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status}: {test_name}")
-        if message:
-            print(f"   {message}")
-        
-        if success:
-            self.test_results["passed"] += 1
-        else:
-            self.test_results["failed"] += 1
-            self.test_results["errors"].append(f"{test_name}: {message}")
+        with self._lock:
+            # Failures are always shown; passes only in verbose mode
+            if self.verbose or not success:
+                lines = [f"{'✅ PASS' if success else '❌ FAIL'}: {test_name}"]
+                if message:
+                    lines.append(f"   {message}")
+                for line in lines:
+                    self.emit(line)
+                if self.tee and not success:
+                    # Echo the failure now as well; suite output stays buffered until the suite ends
+                    sys.stdout.write("\n".join(lines) + "\n")
+                    sys.stdout.flush()
+            
+            if success:
+                self.test_results["passed"] += 1
+            else:
+                self.test_results["failed"] += 1
+                self.test_results["errors"].append((test_name, message))
 
-    def make_request(self, method: str, endpoint: str, data: Dict = None, params: Dict = None) -> requests.Response:
-        """Make HTTP request with error handling"""
+    def make_request(self, method: str, endpoint: str, data: dict[str, Any] | None = None,
+                     params: dict[str, Any] | None = None, status_only: bool = False) -> Response | None:
+        """Make HTTP request with error handling.
+        With status_only the body is discarded unread; only status_code is usable."""
         url = f"{self.base_url}{endpoint}"
+        method = method.upper()
+        if method not in _METHODS:
+            raise ValueError(f"Unsupported method: {method}")
+        if params is not None and method != "GET":
+            # urllib3 would multipart-encode them as the body instead of adding them to the URL
+            raise ValueError(f"Query params are only supported for GET, not {method}")
+        
         try:
-            if method.upper() == "GET":
-                response = self.session.get(url, params=params, timeout=10)
-            elif method.upper() == "POST":
-                response = self.session.post(url, json=data, timeout=10)
-            elif method.upper() == "PUT":
-                response = self.session.put(url, json=data, timeout=10)
-            elif method.upper() == "DELETE":
-                response = self.session.delete(url, timeout=10)
-            else:
-                raise ValueError(f"Unsupported method: {method}")
-            
-            return response
-        except requests.exceptions.RequestException as e:
-            print(f"Request failed: {e}")
+            response = self.http.request(
+                method,
+                url,
+                body=orjson.dumps(data) if data is not None else None,
+                fields=params if method == "GET" else None,
+                timeout=10.0,
+                preload_content=not status_only
+            )
+        except urllib3.exceptions.HTTPError as e:
+            self.emit(f"Request failed: {e}")
             return None
+        if status_only:
+            # Drain rather than just release, so the connection goes back to the pool
+            response.drain_conn()
+            return Response(response.status, b"", response.headers)
+        return Response(response.status, response.data, response.headers)
+
+    def make_requests(self, calls: list[tuple]) -> Iterator[tuple[int, Response | None]]:
+        """Make independent (method, endpoint, data) requests concurrently.
+        Yields (index into calls, response) as each request completes."""
+        # Workers write into the calling suite's buffer, so request errors stay in that suite's block
+        buffer = getattr(self._local, "buffer", None)
+        
+        def request(call: tuple) -> Response | None:
+            self._local.buffer = buffer
+            return self.make_request(*call)
+        
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {executor.submit(request, call): i for i, call in enumerate(calls)}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def fetch_all(self, calls: list[tuple]) -> list[Response | None]:
+        """Make independent requests concurrently and return the responses in call order"""
+        responses: list[Response | None] = [None] * len(calls)
+        for i, response in self.make_requests(calls):
+            responses[i] = response
+        return responses
+
+    def warm_up(self) -> None:
+        """Open a connection before the suites run so they don't pay for the TLS handshake"""
+        try:
+            self.http.request("GET", f"{self.base_url}/", timeout=10.0)
+        except urllib3.exceptions.HTTPError:
+            pass
 
-    def test_api_root(self):
+    def test_api_root(self) -> None:
         """Test API root endpoint"""
-        print("\n=== Testing API Root ===")
+        self.emit("\n=== Testing API Root ===")
         response = self.make_request("GET", "/")
         
-        if response and response.status_code == 200:
-            data = response.json()
+        if response is not None and response.status_code == 200:
+            data = _json(response)
             if "message" in data:
                 self.log_result("API Root", True, f"Message: {data['message']}")
             else:
                 self.log_result("API Root", False, "Missing message in response")
         else:
-            self.log_result("API Root", False, f"Status: {response.status_code if response else 'No response'}")
+            self.log_result("API Root", False, f"Status: {self._status(response)}")
 
-    def test_student_crud(self):
+    def test_student_crud(self) -> None:
         """Test complete Student CRUD operations"""
-        print("\n=== Testing Student Management API ===")
-        
-        # Test data for students
-        students_data = [
-            {
-                "student_id": "STU001",
-                "first_name": "Emma",
-                "last_name": "Johnson",
-                "email": "emma.johnson@email.com",
-                "phone": "555-0101",
-                "date_of_birth": "2010-03-15",
-                "gender": "female",
-                "grade_level": "Grade 8",
-                "address": "123 Oak Street, Springfield",
-                "parent_name": "Michael Johnson",
-                "parent_email": "michael.johnson@email.com",
-                "parent_phone": "555-0102"
-            },
-            {
-                "student_id": "STU002",
-                "first_name": "Liam",
-                "last_name": "Smith",
-                "email": "liam.smith@email.com",
-                "phone": "555-0201",
-                "date_of_birth": "2009-07-22",
-                "gender": "male",
-                "grade_level": "Grade 9",
-                "address": "456 Pine Avenue, Springfield",
-                "parent_name": "Sarah Smith",
-                "parent_email": "sarah.smith@email.com",
-                "parent_phone": "555-0202"
-            },
-            {
-                "student_id": "STU003",
-                "first_name": "Sophia",
-                "last_name": "Williams",
-                "email": "sophia.williams@email.com",
-                "phone": "555-0301",
-                "date_of_birth": "2011-11-08",
-                "gender": "female",
-                "grade_level": "Grade 7",
-                "address": "789 Maple Drive, Springfield",
-                "parent_name": "David Williams",
-                "parent_email": "david.williams@email.com",
-                "parent_phone": "555-0302"
-            },
-            {
-                "student_id": "STU004",
-                "first_name": "Noah",
-                "last_name": "Brown",
-                "email": "noah.brown@email.com",
-                "phone": "555-0401",
-                "date_of_birth": "2008-05-12",
-                "gender": "male",
-                "grade_level": "Grade 10",
-                "address": "321 Elm Street, Springfield",
-                "parent_name": "Jennifer Brown",
-                "parent_email": "jennifer.brown@email.com",
-                "parent_phone": "555-0402"
-            },
-            {
-                "student_id": "STU005",
-                "first_name": "Olivia",
-                "last_name": "Davis",
-                "email": "olivia.davis@email.com",
-                "phone": "555-0501",
-                "date_of_birth": "2012-01-30",
-                "gender": "female",
-                "grade_level": "Grade 6",
-                "address": "654 Cedar Lane, Springfield",
-                "parent_name": "Robert Davis",
-                "parent_email": "robert.davis@email.com",
-                "parent_phone": "555-0502"
-            }
-        ]
+        self.emit("\n=== Testing Student Management API ===")
 
         # Test 1: Create students
-        print("\n--- Creating Students ---")
-        for student_data in students_data:
-            response = self.make_request("POST", "/students", student_data)
-            if response and response.status_code == 200:
-                student = response.json()
+        self.emit("\n--- Creating Students ---")
+        creates = [("POST", "/students", student_data) for student_data in _STUDENTS_DATA]
+        for i, response in self.make_requests(creates):
+            student_data = _STUDENTS_DATA[i]
+            if response is not None and response.status_code == 200:
+                student = _json(response)
                 self.created_students.append(student)
                 self.log_result(f"Create Student {student_data['student_id']}", True, f"ID: {student['id']}")
             else:
-                error_msg = response.json().get('detail', 'Unknown error') if response else 'No response'
-                self.log_result(f"Create Student {student_data['student_id']}", False, f"Status: {response.status_code if response else 'No response'}, Error: {error_msg}")
+                error_msg = _json(response).get('detail', 'Unknown error') if response is not None else 'No response'
+                self.log_result(f"Create Student {student_data['student_id']}", False, f"Status: {self._status(response)}, Error: {error_msg}")
 
         # Test 2: Test duplicate student ID
-        print("\n--- Testing Duplicate Student ID ---")
-        if students_data:
-            response = self.make_request("POST", "/students", students_data[0])
-            if response and response.status_code == 400:
+        self.emit("\n--- Testing Duplicate Student ID ---")
+        if _STUDENTS_DATA:
+            response = self.make_request("POST", "/students", _STUDENTS_DATA[0], status_only=True)
+            if response is not None and response.status_code == 400:
                 self.log_result("Duplicate Student ID Validation", True, "Correctly rejected duplicate")
             else:
-                self.log_result("Duplicate Student ID Validation", False, f"Status: {response.status_code if response else 'No response'}")
+                self.log_result("Duplicate Student ID Validation", False, f"Status: {self._status(response)}")
+
+        # Tests 3, 4, 6, 7, 8 and 11 are independent reads, so fetch them all at once
+        # and check the responses in order below
+        (all_response, page_response, bad_cursor_response, grade_response, status_response, count_response,
+         students_page_response, missing_response) = self.fetch_all([
+            ("GET", "/students"),
+            ("GET", "/students", None, {"skip": 0, "limit": 2}),
+            ("GET", "/students", None, {"after": "not-a-cursor"}, True),
+            ("GET", "/students", None, {"grade_level": "Grade 8"}),
+            ("GET", "/students", None, {"status": "active"}),
+            ("GET", "/students/count"),
+            ("GET", "/students/page", None, {"limit": 2}),
+            ("GET", "/students/non-existent-id", None, None, True)
+        ])
 
         # Test 3: Get all students
-        print("\n--- Getting All Students ---")
-        response = self.make_request("GET", "/students")
-        if response and response.status_code == 200:
-            students = response.json()
+        self.emit("\n--- Getting All Students ---")
+        response = all_response
+        if response is not None and response.status_code == 200:
+            students = _json(response)
             self.log_result("Get All Students", True, f"Retrieved {len(students)} students")
         else:
-            self.log_result("Get All Students", False, f"Status: {response.status_code if response else 'No response'}")
+            self.log_result("Get All Students", False, f"Status: {self._status(response)}")
 
         # Test 4: Test pagination
-        print("\n--- Testing Pagination ---")
-        response = self.make_request("GET", "/students", params={"skip": 0, "limit": 2})
-        if response and response.status_code == 200:
-            students = response.json()
+        self.emit("\n--- Testing Pagination ---")
+        response = page_response
+        if response is not None and response.status_code == 200:
+            students = _json(response)
             if len(students) <= 2:
                 self.log_result("Student Pagination", True, f"Retrieved {len(students)} students with limit=2")
             else:
                 self.log_result("Student Pagination", False, f"Expected ≤2 students, got {len(students)}")
         else:
-            self.log_result("Student Pagination", False, f"Status: {response.status_code if response else 'No response'}")
+            self.log_result("Student Pagination", False, f"Status: {self._status(response)}")
+
+        # The next page follows the X-Next-Cursor of the first one and must not repeat its rows
+        first_page = _json(response) if response is not None and response.status_code == 200 else []
+        if len(first_page) == 2:
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                self.log_result("Cursor Pagination", False, "No X-Next-Cursor header on a full page")
+            else:
+                response = self.make_request("GET", "/students", params={"limit": 2, "after": cursor})
+                if response is not None and response.status_code == 200:
+                    overlap = {s['id'] for s in first_page} & {s['id'] for s in _json(response)}
+                    if not overlap:
+                        self.log_result("Cursor Pagination", True, "Second page doesn't repeat the first")
+                    else:
+                        self.log_result("Cursor Pagination", False, f"Pages overlap on {sorted(overlap)}")
+                else:
+                    self.log_result("Cursor Pagination", False, f"Status: {self._status(response)}")
+
+        response = bad_cursor_response
+        if response is not None and response.status_code == 400:
+            self.log_result("Invalid Cursor", True, "Correctly rejected malformed cursor")
+        else:
+            self.log_result("Invalid Cursor", False, f"Expected 400, got {self._status(response)}")
 
         # Test 5: Test search functionality
-        print("\n--- Testing Search Functionality ---")
+        self.emit("\n--- Testing Search Functionality ---")
         search_tests = [
             ("Emma", "first name search"),
             ("Johnson", "last name search"),
@@ -203,76 +442,95 @@ class SchoolAPITester:
             ("emma.johnson", "email search")
         ]
         
-        for search_term, test_desc in search_tests:
-            response = self.make_request("GET", "/students", params={"search": search_term})
-            if response and response.status_code == 200:
-                students = response.json()
-                found = any(search_term.lower() in str(student.get('first_name', '')).lower() or
-                           search_term.lower() in str(student.get('last_name', '')).lower() or
-                           search_term.lower() in str(student.get('student_id', '')).lower() or
-                           search_term.lower() in str(student.get('email', '')).lower()
-                           for student in students)
+        # The searches are independent, so issue them together
+        search_responses = self.fetch_all([("GET", "/students", None, {"search": search_term})
+                                           for search_term, _ in search_tests])
+        for (search_term, test_desc), response in zip(search_tests, search_responses):
+            if response is not None and response.status_code == 200:
+                students = _json(response)
+                # One string per student covering every searchable field, matched
+                # case-insensitively by a pattern compiled once per term
+                haystacks = [f"{s.get('first_name') or ''}|{s.get('last_name') or ''}|"
+                             f"{s.get('student_id') or ''}|{s.get('email') or ''}"
+                             for s in students]
+                pattern = re.compile(re.escape(search_term), re.IGNORECASE)
+                found = any(pattern.search(haystack) for haystack in haystacks)
                 if found or len(students) == 0:  # Empty result is also valid
                     self.log_result(f"Search - {test_desc}", True, f"Found {len(students)} results")
                 else:
                     self.log_result(f"Search - {test_desc}", False, "Search term not found in results")
             else:
-                self.log_result(f"Search - {test_desc}", False, f"Status: {response.status_code if response else 'No response'}")
+                self.log_result(f"Search - {test_desc}", False, f"Status: {self._status(response)}")
 
         # Test 6: Test filtering by grade level
-        print("\n--- Testing Grade Level Filter ---")
-        response = self.make_request("GET", "/students", params={"grade_level": "Grade 8"})
-        if response and response.status_code == 200:
-            students = response.json()
-            grade_8_students = [s for s in students if s.get('grade_level') == 'Grade 8']
-            if len(grade_8_students) == len(students):
+        self.emit("\n--- Testing Grade Level Filter ---")
+        response = grade_response
+        if response is not None and response.status_code == 200:
+            students = _json(response)
+            if all(s.get('grade_level') == 'Grade 8' for s in students):
                 self.log_result("Grade Level Filter", True, f"Found {len(students)} Grade 8 students")
             else:
                 self.log_result("Grade Level Filter", False, "Filter returned incorrect results")
         else:
-            self.log_result("Grade Level Filter", False, f"Status: {response.status_code if response else 'No response'}")
+            self.log_result("Grade Level Filter", False, f"Status: {self._status(response)}")
 
         # Test 7: Test filtering by status
-        print("\n--- Testing Status Filter ---")
-        response = self.make_request("GET", "/students", params={"status": "active"})
-        if response and response.status_code == 200:
-            students = response.json()
-            active_students = [s for s in students if s.get('status') == 'active']
-            if len(active_students) == len(students):
+        self.emit("\n--- Testing Status Filter ---")
+        response = status_response
+        if response is not None and response.status_code == 200:
+            students = _json(response)
+            if all(s.get('status') == 'active' for s in students):
                 self.log_result("Status Filter", True, f"Found {len(students)} active students")
             else:
                 self.log_result("Status Filter", False, "Filter returned incorrect results")
         else:
-            self.log_result("Status Filter", False, f"Status: {response.status_code if response else 'No response'}")
+            self.log_result("Status Filter", False, f"Status: {self._status(response)}")
 
         # Test 8: Get student count
-        print("\n--- Testing Student Count ---")
-        response = self.make_request("GET", "/students/count")
-        if response and response.status_code == 200:
-            count_data = response.json()
+        self.emit("\n--- Testing Student Count ---")
+        response = count_response
+        if response is not None and response.status_code == 200:
+            count_data = _json(response)
             if "count" in count_data and isinstance(count_data["count"], int):
                 self.log_result("Student Count", True, f"Total count: {count_data['count']}")
             else:
                 self.log_result("Student Count", False, "Invalid count response format")
         else:
-            self.log_result("Student Count", False, f"Status: {response.status_code if response else 'No response'}")
+            self.log_result("Student Count", False, f"Status: {self._status(response)}")
+
+        # The page endpoint returns one page of items plus the same total as /students/count
+        self.emit("\n--- Testing Students Page ---")
+        response = students_page_response
+        if response is not None and response.status_code == 200:
+            page = _json(response)
+            items, total = page.get("items"), page.get("total")
+            if not isinstance(items, list) or not isinstance(total, int) or len(items) > 2:
+                self.log_result("Students Page", False, f"Unexpected page shape: {page}")
+            elif count_response is not None and count_response.status_code == 200 \
+                    and total != _json(count_response).get("count"):
+                self.log_result("Students Page", False,
+                                f"total {total} != count {_json(count_response).get('count')}")
+            else:
+                self.log_result("Students Page", True, f"{len(items)} items, total {total}")
+        else:
+            self.log_result("Students Page", False, f"Status: {self._status(response)}")
 
         # Test 9: Get individual student
-        print("\n--- Testing Individual Student Retrieval ---")
+        self.emit("\n--- Testing Individual Student Retrieval ---")
         if self.created_students:
             student_id = self.created_students[0]['id']
             response = self.make_request("GET", f"/students/{student_id}")
-            if response and response.status_code == 200:
-                student = response.json()
+            if response is not None and response.status_code == 200:
+                student = _json(response)
                 if student['id'] == student_id:
                     self.log_result("Get Individual Student", True, f"Retrieved student: {student['first_name']} {student['last_name']}")
                 else:
                     self.log_result("Get Individual Student", False, "Wrong student returned")
             else:
-                self.log_result("Get Individual Student", False, f"Status: {response.status_code if response else 'No response'}")
+                self.log_result("Get Individual Student", False, f"Status: {self._status(response)}")
 
         # Test 10: Update student
-        print("\n--- Testing Student Update ---")
+        self.emit("\n--- Testing Student Update ---")
         if self.created_students:
             student_id = self.created_students[0]['id']
             update_data = {
@@ -280,197 +538,142 @@ class SchoolAPITester:
                 "status": "inactive"
             }
             response = self.make_request("PUT", f"/students/{student_id}", update_data)
-            if response and response.status_code == 200:
-                updated_student = response.json()
+            if response is not None and response.status_code == 200:
+                updated_student = _json(response)
                 if updated_student['phone'] == "555-9999" and updated_student['status'] == "inactive":
                     self.log_result("Update Student", True, "Student updated successfully")
                 else:
                     self.log_result("Update Student", False, "Update not reflected in response")
             else:
-                self.log_result("Update Student", False, f"Status: {response.status_code if response else 'No response'}")
+                self.log_result("Update Student", False, f"Status: {self._status(response)}")
 
         # Test 11: Test 404 for non-existent student
-        print("\n--- Testing Non-existent Student ---")
-        response = self.make_request("GET", "/students/non-existent-id")
-        if response and response.status_code == 404:
+        self.emit("\n--- Testing Non-existent Student ---")
+        response = missing_response
+        if response is not None and response.status_code == 404:
             self.log_result("Non-existent Student 404", True, "Correctly returned 404")
         else:
-            self.log_result("Non-existent Student 404", False, f"Status: {response.status_code if response else 'No response'}")
+            self.log_result("Non-existent Student 404", False, f"Status: {self._status(response)}")
 
-    def test_teacher_crud(self):
+    def test_teacher_crud(self) -> None:
         """Test Teacher CRUD operations"""
-        print("\n=== Testing Teacher Management API ===")
-        
-        teachers_data = [
-            {
-                "teacher_id": "TCH001",
-                "first_name": "Dr. Sarah",
-                "last_name": "Anderson",
-                "email": "sarah.anderson@school.edu",
-                "phone": "555-1001",
-                "subject_specialization": "Mathematics"
-            },
-            {
-                "teacher_id": "TCH002",
-                "first_name": "Mr. James",
-                "last_name": "Wilson",
-                "email": "james.wilson@school.edu",
-                "phone": "555-1002",
-                "subject_specialization": "English Literature"
-            },
-            {
-                "teacher_id": "TCH003",
-                "first_name": "Ms. Maria",
-                "last_name": "Garcia",
-                "email": "maria.garcia@school.edu",
-                "phone": "555-1003",
-                "subject_specialization": "Science"
-            }
-        ]
+        self.emit("\n=== Testing Teacher Management API ===")
 
         # Test 1: Create teachers
-        print("\n--- Creating Teachers ---")
-        for teacher_data in teachers_data:
-            response = self.make_request("POST", "/teachers", teacher_data)
-            if response and response.status_code == 200:
-                teacher = response.json()
+        self.emit("\n--- Creating Teachers ---")
+        creates = [("POST", "/teachers", teacher_data) for teacher_data in _TEACHERS_DATA]
+        for i, response in self.make_requests(creates):
+            teacher_data = _TEACHERS_DATA[i]
+            if response is not None and response.status_code == 200:
+                teacher = _json(response)
                 self.created_teachers.append(teacher)
                 self.log_result(f"Create Teacher {teacher_data['teacher_id']}", True, f"ID: {teacher['id']}")
             else:
-                error_msg = response.json().get('detail', 'Unknown error') if response else 'No response'
-                self.log_result(f"Create Teacher {teacher_data['teacher_id']}", False, f"Status: {response.status_code if response else 'No response'}, Error: {error_msg}")
+                error_msg = _json(response).get('detail', 'Unknown error') if response is not None else 'No response'
+                self.log_result(f"Create Teacher {teacher_data['teacher_id']}", False, f"Status: {self._status(response)}, Error: {error_msg}")
 
         # Test 2: Get all teachers
-        print("\n--- Getting All Teachers ---")
+        self.emit("\n--- Getting All Teachers ---")
         response = self.make_request("GET", "/teachers")
-        if response and response.status_code == 200:
-            teachers = response.json()
+        if response is not None and response.status_code == 200:
+            teachers = _json(response)
             self.log_result("Get All Teachers", True, f"Retrieved {len(teachers)} teachers")
         else:
-            self.log_result("Get All Teachers", False, f"Status: {response.status_code if response else 'No response'}")
+            self.log_result("Get All Teachers", False, f"Status: {self._status(response)}")
 
         # Test 3: Get individual teacher
-        print("\n--- Testing Individual Teacher Retrieval ---")
+        self.emit("\n--- Testing Individual Teacher Retrieval ---")
         if self.created_teachers:
             teacher_id = self.created_teachers[0]['id']
             response = self.make_request("GET", f"/teachers/{teacher_id}")
-            if response and response.status_code == 200:
-                teacher = response.json()
+            if response is not None and response.status_code == 200:
+                teacher = _json(response)
                 if teacher['id'] == teacher_id:
                     self.log_result("Get Individual Teacher", True, f"Retrieved teacher: {teacher['first_name']} {teacher['last_name']}")
                 else:
                     self.log_result("Get Individual Teacher", False, "Wrong teacher returned")
             else:
-                self.log_result("Get Individual Teacher", False, f"Status: {response.status_code if response else 'No response'}")
+                self.log_result("Get Individual Teacher", False, f"Status: {self._status(response)}")
 
         # Test 4: Test duplicate teacher ID
-        print("\n--- Testing Duplicate Teacher ID ---")
-        if teachers_data:
-            response = self.make_request("POST", "/teachers", teachers_data[0])
-            if response and response.status_code == 400:
+        self.emit("\n--- Testing Duplicate Teacher ID ---")
+        if _TEACHERS_DATA:
+            response = self.make_request("POST", "/teachers", _TEACHERS_DATA[0], status_only=True)
+            if response is not None and response.status_code == 400:
                 self.log_result("Duplicate Teacher ID Validation", True, "Correctly rejected duplicate")
             else:
-                self.log_result("Duplicate Teacher ID Validation", False, f"Status: {response.status_code if response else 'No response'}")
+                self.log_result("Duplicate Teacher ID Validation", False, f"Status: {self._status(response)}")
 
-    def test_course_crud(self):
+    def test_course_crud(self) -> None:
         """Test Course CRUD operations"""
-        print("\n=== Testing Course Management API ===")
-        
-        courses_data = [
-            {
-                "course_code": "MATH101",
-                "course_name": "Algebra I",
-                "description": "Introduction to algebraic concepts and problem solving",
-                "credit_hours": 3,
-                "grade_levels": ["Grade 8", "Grade 9"]
-            },
-            {
-                "course_code": "ENG201",
-                "course_name": "English Literature",
-                "description": "Study of classic and contemporary literature",
-                "credit_hours": 4,
-                "grade_levels": ["Grade 10", "Grade 11", "Grade 12"]
-            },
-            {
-                "course_code": "SCI301",
-                "course_name": "Biology",
-                "description": "Introduction to biological sciences",
-                "credit_hours": 4,
-                "grade_levels": ["Grade 9", "Grade 10"]
-            }
-        ]
+        self.emit("\n=== Testing Course Management API ===")
 
         # Test 1: Create courses
-        print("\n--- Creating Courses ---")
-        for course_data in courses_data:
-            response = self.make_request("POST", "/courses", course_data)
-            if response and response.status_code == 200:
-                course = response.json()
+        self.emit("\n--- Creating Courses ---")
+        creates = [("POST", "/courses", course_data) for course_data in _COURSES_DATA]
+        for i, response in self.make_requests(creates):
+            course_data = _COURSES_DATA[i]
+            if response is not None and response.status_code == 200:
+                course = _json(response)
                 self.created_courses.append(course)
                 self.log_result(f"Create Course {course_data['course_code']}", True, f"ID: {course['id']}")
             else:
-                error_msg = response.json().get('detail', 'Unknown error') if response else 'No response'
-                self.log_result(f"Create Course {course_data['course_code']}", False, f"Status: {response.status_code if response else 'No response'}, Error: {error_msg}")
+                error_msg = _json(response).get('detail', 'Unknown error') if response is not None else 'No response'
+                self.log_result(f"Create Course {course_data['course_code']}", False, f"Status: {self._status(response)}, Error: {error_msg}")
 
         # Test 2: Get all courses
-        print("\n--- Getting All Courses ---")
+        self.emit("\n--- Getting All Courses ---")
         response = self.make_request("GET", "/courses")
-        if response and response.status_code == 200:
-            courses = response.json()
+        if response is not None and response.status_code == 200:
+            courses = _json(response)
             self.log_result("Get All Courses", True, f"Retrieved {len(courses)} courses")
         else:
-            self.log_result("Get All Courses", False, f"Status: {response.status_code if response else 'No response'}")
+            self.log_result("Get All Courses", False, f"Status: {self._status(response)}")
 
         # Test 3: Test duplicate course code
-        print("\n--- Testing Duplicate Course Code ---")
-        if courses_data:
-            response = self.make_request("POST", "/courses", courses_data[0])
-            if response and response.status_code == 400:
+        self.emit("\n--- Testing Duplicate Course Code ---")
+        if _COURSES_DATA:
+            response = self.make_request("POST", "/courses", _COURSES_DATA[0], status_only=True)
+            if response is not None and response.status_code == 400:
                 self.log_result("Duplicate Course Code Validation", True, "Correctly rejected duplicate")
             else:
-                self.log_result("Duplicate Course Code Validation", False, f"Status: {response.status_code if response else 'No response'}")
+                self.log_result("Duplicate Course Code Validation", False, f"Status: {self._status(response)}")
 
-    def test_dashboard_stats(self):
+    def test_dashboard_stats(self) -> None:
         """Test Dashboard Statistics API"""
-        print("\n=== Testing Dashboard Statistics API ===")
+        self.emit("\n=== Testing Dashboard Statistics API ===")
         
         response = self.make_request("GET", "/dashboard/stats")
-        if response and response.status_code == 200:
-            stats = response.json()
-            required_fields = ["total_students", "active_students", "total_teachers", "total_courses", "students_by_grade", "recent_enrollments"]
-            
-            missing_fields = [field for field in required_fields if field not in stats]
+        if response is not None and response.status_code == 200:
+            stats = _json(response)
+            missing_fields = [field for field in _DASHBOARD_FIELDS if field not in stats]
             if not missing_fields:
                 self.log_result("Dashboard Stats Structure", True, "All required fields present")
                 
                 # Validate data types
-                if (isinstance(stats["total_students"], int) and
-                    isinstance(stats["active_students"], int) and
-                    isinstance(stats["total_teachers"], int) and
-                    isinstance(stats["total_courses"], int) and
-                    isinstance(stats["students_by_grade"], dict) and
-                    isinstance(stats["recent_enrollments"], int)):
+                values = _get_dashboard_fields(stats)
+                if all(isinstance(value, expected) for value, expected in zip(values, _DASHBOARD_TYPES)):
                     
                     self.log_result("Dashboard Stats Data Types", True, "All fields have correct data types")
                     
                     # Log actual values
-                    print(f"   Total Students: {stats['total_students']}")
-                    print(f"   Active Students: {stats['active_students']}")
-                    print(f"   Total Teachers: {stats['total_teachers']}")
-                    print(f"   Total Courses: {stats['total_courses']}")
-                    print(f"   Students by Grade: {stats['students_by_grade']}")
-                    print(f"   Recent Enrollments: {stats['recent_enrollments']}")
+                    self.emit(f"   Total Students: {stats['total_students']}")
+                    self.emit(f"   Active Students: {stats['active_students']}")
+                    self.emit(f"   Total Teachers: {stats['total_teachers']}")
+                    self.emit(f"   Total Courses: {stats['total_courses']}")
+                    self.emit(f"   Students by Grade: {stats['students_by_grade']}")
+                    self.emit(f"   Recent Enrollments: {stats['recent_enrollments']}")
                     
                 else:
                     self.log_result("Dashboard Stats Data Types", False, "Incorrect data types in response")
             else:
                 self.log_result("Dashboard Stats Structure", False, f"Missing fields: {missing_fields}")
         else:
-            self.log_result("Dashboard Stats", False, f"Status: {response.status_code if response else 'No response'}")
+            self.log_result("Dashboard Stats", False, f"Status: {self._status(response)}")
 
-    def test_email_validation(self):
+    def test_email_validation(self) -> None:
         """Test email validation"""
-        print("\n=== Testing Email Validation ===")
+        self.emit("\n=== Testing Email Validation ===")
         
         invalid_student = {
             "student_id": "STU999",
@@ -482,50 +685,77 @@ class SchoolAPITester:
             "grade_level": "Grade 8"
         }
         
-        response = self.make_request("POST", "/students", invalid_student)
-        if response and response.status_code == 422:  # Validation error
+        response = self.make_request("POST", "/students", invalid_student, status_only=True)
+        if response is not None and response.status_code == 422:  # Validation error
             self.log_result("Email Validation", True, "Correctly rejected invalid email")
         else:
-            self.log_result("Email Validation", False, f"Status: {response.status_code if response else 'No response'}")
+            self.log_result("Email Validation", False, f"Status: {self._status(response)}")
 
-    def cleanup_test_data(self):
+    def test_student_scale(self, n: int) -> None:
+        """Create n generated students concurrently"""
+        self.emit(f"\n=== Testing Student Creation at Scale ({n}) ===")
+        
+        # Generate the payloads before timing so only the API calls are measured
+        students_data = build_students(n)
+        start = time.perf_counter()
+        failures = 0
+        for _, response in self.make_requests([("POST", "/students", data) for data in students_data]):
+            if response is not None and response.status_code == 200:
+                self.created_students.append(_json(response))
+            else:
+                failures += 1
+        elapsed = time.perf_counter() - start
+        
+        self.log_result("Student Creation at Scale", failures == 0,
+                        f"Created {n - failures}/{n} students in {elapsed:.2f}s")
+
+    def cleanup_test_data(self) -> None:
         """Clean up created test data"""
-        print("\n=== Cleaning Up Test Data ===")
+        self.emit("\n=== Cleaning Up Test Data ===")
         
         # Delete created students
-        for student in self.created_students:
-            response = self.make_request("DELETE", f"/students/{student['id']}")
-            if response and response.status_code == 200:
-                print(f"✅ Deleted student: {student['first_name']} {student['last_name']}")
+        deletes = [("DELETE", f"/students/{student['id']}") for student in self.created_students]
+        for i, response in self.make_requests(deletes):
+            student = self.created_students[i]
+            if response is not None and response.status_code == 200:
+                self.emit(f"✅ Deleted student: {student['first_name']} {student['last_name']}")
             else:
-                print(f"❌ Failed to delete student: {student['first_name']} {student['last_name']}")
+                self.emit(f"❌ Failed to delete student: {student['first_name']} {student['last_name']}")
 
-    def run_all_tests(self):
+    def run_all_tests(self) -> bool:
         """Run all test suites"""
-        print("🚀 Starting School Management API Tests")
-        print(f"Backend URL: {self.base_url}")
-        print("=" * 60)
+        try:
+            return self._run_all_tests()
+        finally:
+            self.flush()
+
+    def _run_all_tests(self) -> bool:
+        self.emit("🚀 Starting School Management API Tests")
+        self.emit(f"Backend URL: {self.base_url}")
+        self.emit("=" * 60)
+        
+        self.warm_up()
         
-        # Run all test suites
+        # Run all test suites. Students, teachers and courses are independent resources,
+        # so their suites overlap; dashboard stats wait for them to finish.
         self.test_api_root()
-        self.test_student_crud()
-        self.test_teacher_crud()
-        self.test_course_crud()
-        self.test_dashboard_stats()
-        self.test_email_validation()
+        self.run_concurrently(self.test_student_crud, self.test_teacher_crud, self.test_course_crud)
+        self.run_concurrently(self.test_dashboard_stats, self.test_email_validation)
+        if self.scale:
+            self.test_student_scale(self.scale)
         
         # Print final results
-        print("\n" + "=" * 60)
-        print("🏁 TEST SUMMARY")
-        print("=" * 60)
-        print(f"✅ Passed: {self.test_results['passed']}")
-        print(f"❌ Failed: {self.test_results['failed']}")
-        print(f"📊 Total: {self.test_results['passed'] + self.test_results['failed']}")
+        self.emit("\n" + "=" * 60)
+        self.emit("🏁 TEST SUMMARY")
+        self.emit("=" * 60)
+        self.emit(f"✅ Passed: {self.test_results['passed']}")
+        self.emit(f"❌ Failed: {self.test_results['failed']}")
+        self.emit(f"📊 Total: {self.test_results['passed'] + self.test_results['failed']}")
         
         if self.test_results['errors']:
-            print("\n❌ FAILED TESTS:")
-            for error in self.test_results['errors']:
-                print(f"   • {error}")
+            self.emit("\n❌ FAILED TESTS:")
+            for name, msg in self.test_results['errors']:
+                self.emit(f"   • {name}: {msg}")
         
         # Cleanup
         self.cleanup_test_data()
@@ -533,6 +763,12 @@ class SchoolAPITester:
         return self.test_results['failed'] == 0
 
 if __name__ == "__main__":
-    tester = SchoolAPITester()
+    parser = argparse.ArgumentParser(description="School Management API tests")
+    parser.add_argument("--quiet", action="store_true", help="only report failures and the summary")
+    parser.add_argument("--scale", type=int, default=0, metavar="N", help="also create N generated students")
+    parser.add_argument("--tee", action="store_true", help="also write each failure to stdout as soon as it happens")
+    args = parser.parse_args()
+    
+    tester = SchoolAPITester(verbose=not args.quiet, scale=args.scale, tee=args.tee)
     success = tester.run_all_tests()
     sys.exit(0 if success else 1)
\ No newline at end of file
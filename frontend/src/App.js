@@ -57,13 +57,10 @@ function App() {
       if (filterGrade) params.append('grade_level', filterGrade);
       if (filterStatus) params.append('status', filterStatus);
 
-      const [studentsResponse, countResponse] = await Promise.all([
-        axios.get(`${API}/students?${params}`),
-        axios.get(`${API}/students/count?${params}`)
-      ]);
+      const response = await axios.get(`${API}/students/page?${params}`);
       
-      setStudents(studentsResponse.data);
-      setTotalStudents(countResponse.data.count);
+      setStudents(response.data.items);
+      setTotalStudents(response.data.total);
     } catch (error) {
       console.error('Error loading students:', error);
     } finally {
@@ -4,123 +4,318 @@ Quick focused test for key APIs
 """
 
 import requests
-import json
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from pathlib import Path
+import orjson
+import socket
+import sys
+import threading
 
 BACKEND_URL = "https://742fbbda-a33c-48cd-b803-8bcf74555207.preview.emergentagent.com/api"
 
-def test_key_apis():
-    print("=== Quick API Test ===")
-    
-    # Test 1: Dashboard Stats
-    print("\n1. Testing Dashboard Stats...")
-    response = requests.get(f"{BACKEND_URL}/dashboard/stats", timeout=10)
-    print(f"Status: {response.status_code}")
-    if response.status_code == 200:
-        data = response.json()
-        print(f"✅ Dashboard Stats: {data}")
+# Every URL the checks use is known up front; only the student ID is filled in at run time
+DASHBOARD_URL = f"{BACKEND_URL}/dashboard/stats"
+STUDENTS_URL = f"{BACKEND_URL}/students"
+STUDENT_URL = f"{BACKEND_URL}/students/{{student_id}}"
+SEARCH_URL = f"{BACKEND_URL}/students?search=Quick"
+BATCH_URL = f"{BACKEND_URL}/batch"
+
+# Independent checks run on this many threads; requests releases the GIL while it waits on the socket
+MAX_WORKERS = 6
+
+# One session for every call, so the TCP+TLS connection is reused via keep-alive. Every call
+# goes to one host, so one per-host pool is enough; it keeps a connection per worker so concurrent
+# checks never wait for one. This stays on HTTP/1.1 because requests has no HTTP/2 support:
+# httpx with http2=True would need the h2 package, and the retry adapter, prepared requests and
+# --in-process adapter below are all requests transport pieces that would have to be rewritten.
+# Transient gateway errors are retried with backoff. POST isn't retried: a create that reached
+# the backend before the gateway failed would come back as a misleading duplicate.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=max(MAX_WORKERS, 10),
+    max_retries=Retry(total=3, backoff_factor=0.25, status_forcelist=(502, 503, 504), raise_on_status=False)
+))
+SESSION.headers.update({"Connection": "keep-alive", "Content-Type": "application/json"})
+
+# Circuit breaker: once this many calls in a row have failed (after retries), the backend is
+# treated as down and the remaining calls are skipped instead of each waiting out its timeout
+BREAKER_THRESHOLD = 3
+FAILS = {"count": 0}
+_fails_lock = threading.Lock()
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of calling a backend that has failed repeatedly"""
+
+def record_call(failed):
+    with _fails_lock:
+        FAILS["count"] = FAILS["count"] + 1 if failed else 0
+
+def guarded(call, *args, **kwargs):
+    """Make a SESSION call behind the circuit breaker. Connection errors and 5xx responses count as failures."""
+    if FAILS["count"] >= BREAKER_THRESHOLD:
+        raise CircuitOpenError(f"skipped after {FAILS['count']} consecutive failures")
+    try:
+        response = call(*args, timeout=10, **kwargs)
+    except requests.exceptions.RequestException:
+        record_call(failed=True)
+        raise
+    record_call(failed=response.status_code >= 500)
+    return response
+
+def send(method, url, **kwargs):
+    return guarded(SESSION.request, method, url, **kwargs)
+
+def send_prepared(request):
+    """Resend a request prepared once at import, skipping Request.prepare.
+    Proxy and CA settings from the environment are applied as SESSION.request would."""
+    settings = SESSION.merge_environment_settings(request.url, {}, None, None, None)
+    return guarded(SESSION.send, request, **settings)
+
+def jload(response):
+    """Decode a response body with orjson"""
+    return orjson.loads(response.content)
+
+# Last ETag seen per URL; sent back as If-None-Match so unchanged resources come back as an empty 304
+ETAGS = {}
+
+def cget(url):
+    """Conditional GET. A 304 means the body is unchanged since the last run of that GET."""
+    etag = ETAGS.get(url)
+    headers = {"If-None-Match": etag} if etag else None
+    response = send("GET", url, headers=headers)
+    if "ETag" in response.headers:
+        ETAGS[url] = response.headers["ETag"]
+    return response
+
+STUDENT_DATA = {
+    "student_id": "QUICK001",
+    "first_name": "Quick",
+    "last_name": "Test",
+    "email": "quick@test.com",
+    "date_of_birth": "2010-01-01",
+    "gender": "male",
+    "grade_level": "Grade 8"
+}
+
+TEACHER_DATA = {
+    "teacher_id": "TCH001",
+    "first_name": "John",
+    "last_name": "Doe",
+    "email": "john.doe@school.edu",
+    "subject_specialization": "Mathematics"
+}
+
+COURSE_DATA = {
+    "course_code": "TEST101",
+    "course_name": "Test Course",
+    "description": "A test course",
+    "credit_hours": 3,
+    "grade_levels": ["Grade 8", "Grade 9"]
+}
+
+# Request bodies never change, so they are serialized once and sent as bytes;
+# the session's default Content-Type header already marks them as JSON
+STUDENT_BODY = orjson.dumps(STUDENT_DATA)
+UPDATE_BODY = orjson.dumps({"phone": "555-1234"})
+CREATES_BATCH_BODY = orjson.dumps({"requests": [
+    {"method": "POST", "path": "/students", "body": STUDENT_DATA},
+    {"method": "POST", "path": "/teachers", "body": TEACHER_DATA},
+    {"method": "POST", "path": "/courses", "body": COURSE_DATA}
+]})
+
+# Writes whose URL and body are both fixed are prepared once and resent as-is
+DUPLICATE_STUDENT = SESSION.prepare_request(requests.Request("POST", STUDENTS_URL, data=STUDENT_BODY))
+CREATES_BATCH = SESSION.prepare_request(requests.Request("POST", BATCH_URL, data=CREATES_BATCH_BODY))
+
+# Simple checks: (number, name, method, URL, serialized body, expected status, summary of a successful body).
+# URLs are formatted with the student ID where they need one.
+DASHBOARD_TEST = (1, "Dashboard Stats", "GET", DASHBOARD_URL, None, 200, lambda stats: stats)
+
+# Each step needs the one before it
+LIFECYCLE_TESTS = (
+    (3, "Get Student", "GET", STUDENT_URL, None, 200, lambda student: student['first_name']),
+    (4, "Update Student", "PUT", STUDENT_URL, UPDATE_BODY, 200, None),
+    (5, "Delete Student", "DELETE", STUDENT_URL, None, 200, None)
+)
+
+# These reuse the lifecycle's student data, so they run once that student is deleted
+AFTER_LIFECYCLE_TESTS = (
+    (7, "Students List", "GET", STUDENTS_URL, None, 200, lambda students: f"{len(students)} students"),
+    (8, "Search Results", "GET", SEARCH_URL, None, 200, lambda students: f"{len(students)} students")
+)
+
+# Checks that send a prepared request: (number, name, request, expected status, summary).
+# The duplicate check also runs once the lifecycle's student is deleted.
+PREPARED_TESTS = (
+    (6, "Duplicate Student ID", DUPLICATE_STUDENT, 400, lambda error: error),
+)
+
+# (number, name, status, ok) for each test, summarized at the end of the run
+RESULTS = []
+
+def record(number, name, status, ok):
+    RESULTS.append((number, name, status, ok))
+
+# Each check returns its output lines, so checks running concurrently don't interleave their output
+def run_test(test, student_id=None):
+    """Run one simple-check table entry"""
+    number, name, method, url, body, expected, summarize = test
+    if student_id is not None:
+        url = url.format(student_id=student_id)
+    request = partial(cget, url) if method == "GET" else partial(send, method, url, data=body)
+    return run_check(number, name, request, expected, summarize)
+
+def run_prepared_test(test):
+    """Run one PREPARED_TESTS entry"""
+    number, name, prepared, expected, summarize = test
+    return run_check(number, name, partial(send_prepared, prepared), expected, summarize)
+
+def run_check(number, name, request, expected, summarize):
+    """Make the check's request and return its output lines"""
+    out = [f"\n{number}. Testing {name}..."]
+    try:
+        response = request()
+    except requests.exceptions.RequestException as e:
+        record(number, name, "No response", False)
+        out.append(f"❌ {name} failed: {e}")
+        return out
+    out.append(f"Status: {response.status_code}")
+    record(number, name, response.status_code, response.status_code in (expected, 304))
+    if response.status_code == expected:
+        out.append(f"✅ {name}: {summarize(jload(response))}" if summarize else f"✅ {name}")
+    elif response.status_code == 304:
+        out.append(f"✅ {name}: unchanged")
     else:
-        print(f"❌ Dashboard Stats failed")
-    
-    # Test 2: Create Student
-    print("\n2. Testing Student Creation...")
-    student_data = {
-        "student_id": "QUICK001",
-        "first_name": "Quick",
-        "last_name": "Test",
-        "email": "quick@test.com",
-        "date_of_birth": "2010-01-01",
-        "gender": "male",
-        "grade_level": "Grade 8"
-    }
-    response = requests.post(f"{BACKEND_URL}/students", json=student_data, timeout=10)
-    print(f"Status: {response.status_code}")
-    if response.status_code == 200:
-        student = response.json()
-        print(f"✅ Student Created: {student['first_name']} {student['last_name']}")
-        student_id = student['id']
-        
-        # Test 3: Get Student
-        print("\n3. Testing Get Student...")
-        response = requests.get(f"{BACKEND_URL}/students/{student_id}", timeout=10)
-        print(f"Status: {response.status_code}")
-        if response.status_code == 200:
-            print(f"✅ Student Retrieved: {response.json()['first_name']}")
-        
-        # Test 4: Update Student
-        print("\n4. Testing Update Student...")
-        update_data = {"phone": "555-1234"}
-        response = requests.put(f"{BACKEND_URL}/students/{student_id}", json=update_data, timeout=10)
-        print(f"Status: {response.status_code}")
-        if response.status_code == 200:
-            print(f"✅ Student Updated")
-        
-        # Test 5: Delete Student
-        print("\n5. Testing Delete Student...")
-        response = requests.delete(f"{BACKEND_URL}/students/{student_id}", timeout=10)
-        print(f"Status: {response.status_code}")
-        if response.status_code == 200:
-            print(f"✅ Student Deleted")
+        out.append(f"❌ {name} failed: {response.text}")
+    return out
+
+def check_creates():
+    """Tests 2, 9 and 10 share one batch request. Returns the new student's ID and each test's output."""
+    student_out = ["\n2. Testing Student Creation..."]
+    teacher_out = ["\n9. Testing Teacher Creation..."]
+    course_out = ["\n10. Testing Course Creation..."]
+    try:
+        # One round trip for all three creates; the response holds each one's status and body
+        response = send_prepared(CREATES_BATCH)
+    except requests.exceptions.RequestException as e:
+        status, error = "No response", e
     else:
-        print(f"❌ Student Creation failed: {response.text}")
-    
-    # Test 6: Duplicate Student ID
-    print("\n6. Testing Duplicate Student ID...")
-    response = requests.post(f"{BACKEND_URL}/students", json=student_data, timeout=10)
-    print(f"Status: {response.status_code}")
-    if response.status_code == 400:
-        print(f"✅ Duplicate validation working: {response.json()}")
+        status, error = response.status_code, response.text
+    if status != 200:
+        for number, name, out in ((2, "Student", student_out), (9, "Teacher", teacher_out), (10, "Course", course_out)):
+            record(number, f"{name} Creation", status, False)
+            out.append(f"Status: {status}")
+            out.append(f"❌ {name} Creation failed: {error}")
+        return None, (student_out, teacher_out, course_out)
+
+    student, teacher, course = jload(response)
+    record(2, "Student Creation", student['status'], student['status'] == 200)
+    record(9, "Teacher Creation", teacher['status'], teacher['status'] == 200)
+    record(10, "Course Creation", course['status'], course['status'] == 200)
+    student_id = None
+    student_out.append(f"Status: {student['status']}")
+    if student['status'] == 200:
+        student = student['body']
+        student_out.append(f"✅ Student Created: {student['first_name']} {student['last_name']}")
+        student_id = student['id']
     else:
-        print(f"❌ Duplicate validation failed")
-    
-    # Test 7: Get Students List
-    print("\n7. Testing Get Students List...")
-    response = requests.get(f"{BACKEND_URL}/students", timeout=10)
-    print(f"Status: {response.status_code}")
-    if response.status_code == 200:
-        students = response.json()
-        print(f"✅ Students List: {len(students)} students")
-    
-    # Test 8: Search Students
-    print("\n8. Testing Search Students...")
-    response = requests.get(f"{BACKEND_URL}/students?search=Quick", timeout=10)
-    print(f"Status: {response.status_code}")
-    if response.status_code == 200:
-        students = response.json()
-        print(f"✅ Search Results: {len(students)} students")
-    
-    # Test 9: Create Teacher
-    print("\n9. Testing Teacher Creation...")
-    teacher_data = {
-        "teacher_id": "TCH001",
-        "first_name": "John",
-        "last_name": "Doe",
-        "email": "john.doe@school.edu",
-        "subject_specialization": "Mathematics"
-    }
-    response = requests.post(f"{BACKEND_URL}/teachers", json=teacher_data, timeout=10)
-    print(f"Status: {response.status_code}")
-    if response.status_code == 200:
-        teacher = response.json()
-        print(f"✅ Teacher Created: {teacher['first_name']} {teacher['last_name']}")
+        student_out.append(f"❌ Student Creation failed: {student['body']}")
+
+    teacher_out.append(f"Status: {teacher['status']}")
+    if teacher['status'] == 200:
+        teacher = teacher['body']
+        teacher_out.append(f"✅ Teacher Created: {teacher['first_name']} {teacher['last_name']}")
     else:
-        print(f"❌ Teacher Creation failed: {response.text}")
-    
-    # Test 10: Create Course
-    print("\n10. Testing Course Creation...")
-    course_data = {
-        "course_code": "TEST101",
-        "course_name": "Test Course",
-        "description": "A test course",
-        "credit_hours": 3,
-        "grade_levels": ["Grade 8", "Grade 9"]
-    }
-    response = requests.post(f"{BACKEND_URL}/courses", json=course_data, timeout=10)
-    print(f"Status: {response.status_code}")
-    if response.status_code == 200:
-        course = response.json()
-        print(f"✅ Course Created: {course['course_name']}")
+        teacher_out.append(f"❌ Teacher Creation failed: {teacher['body']}")
+
+    course_out.append(f"Status: {course['status']}")
+    if course['status'] == 200:
+        course_out.append(f"✅ Course Created: {course['body']['course_name']}")
     else:
-        print(f"❌ Course Creation failed: {response.text}")
+        course_out.append(f"❌ Course Creation failed: {course['body']}")
+    return student_id, (student_out, teacher_out, course_out)
+
+class InProcessAdapter(BaseAdapter):
+    """Transport adapter that hands requests to the backend app's TestClient instead of the network"""
+
+    def __init__(self, client):
+        super().__init__()
+        self.client = client
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        result = self.client.request(request.method, request.path_url, content=request.body,
+                                     headers=dict(request.headers))
+        response = requests.Response()
+        response.status_code = result.status_code
+        response._content = result.content
+        response.headers = CaseInsensitiveDict(result.headers)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+# With --in-process these calls go straight to the app; everything else still crosses the network
+IN_PROCESS_PREFIXES = (STUDENTS_URL, BATCH_URL)
+
+@contextmanager
+def in_process_backend():
+    """Serve the student and batch calls from the FastAPI app in this process.
+    The app's startup and shutdown handlers run, so it needs the database in backend/.env."""
+    sys.path.insert(0, str(Path(__file__).parent / "backend"))
+    from fastapi.testclient import TestClient
+    from server import app
+
+    with TestClient(app) as client:
+        adapter = InProcessAdapter(client)
+        for prefix in IN_PROCESS_PREFIXES:
+            SESSION.mount(prefix, adapter)
+        yield
+
+def test_key_apis():
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # Dashboard stats don't depend on anything, so they run alongside the creates and lifecycle
+        dashboard = executor.submit(run_test, DASHBOARD_TEST)
+        student_id, (created, teacher, course) = check_creates()
+        lifecycle = []
+        if student_id is not None:
+            for test in LIFECYCLE_TESTS:
+                lifecycle += run_test(test, student_id)
+        later = [*executor.map(run_prepared_test, PREPARED_TESTS), *executor.map(run_test, AFTER_LIFECYCLE_TESTS)]
+        dashboard = dashboard.result()
+
+    # All output is written at once at the end, in test-number order
+    lines = ["=== Quick API Test ==="]
+    for out in (dashboard, created, lifecycle, *later, teacher, course):
+        lines.extend(out)
+    lines.append("\n=== Summary ===")
+    lines.extend(f"{'✅' if ok else '❌'} {name} [{status}]" for number, name, status, ok in sorted(RESULTS))
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
-    test_key_apis()
\ No newline at end of file
+    # Every call goes to the same host, so resolve it once rather than for each new pooled connection.
+    # Failed lookups raise and so are never cached. This is process-wide, so it's only done when
+    # the script runs on its own, never on import (pytest collects this file).
+    socket.getaddrinfo = lru_cache(maxsize=None)(socket.getaddrinfo)
+
+    parser = argparse.ArgumentParser(description="Quick focused test for key APIs")
+    parser.add_argument("--in-process", action="store_true",
+                        help="run the student and batch calls against the backend app in this process; "
+                             "dashboard stats still go over the network as a deployment smoke test. "
+                             "The app pings MongoDB on startup, so this fails within about 2s if the "
+                             "database in backend/.env is unreachable")
+    args = parser.parse_args()
+
+    if args.in_process:
+        with in_process_backend():
+            test_key_apis()
+    else:
+        test_key_apis()